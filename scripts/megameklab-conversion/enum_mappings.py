@@ -8,6 +8,7 @@ Usage:
     from enum_mappings import map_tech_base, map_engine_type, map_armor_location
 """
 
+from functools import lru_cache
 from typing import Optional, Dict
 
 # =============================================================================
@@ -444,6 +445,7 @@ ARMOR_LOCATION_KEY_MAP: Dict[str, str] = {
 }
 
 
+@lru_cache(maxsize=64)
 def map_mech_location(value: str) -> str:
     """Map MTF location string to TypeScript enum value."""
     clean = value.strip()
@@ -602,6 +604,7 @@ def generate_id_from_name(chassis: str, model: str) -> str:
     return id_str.strip("-")
 
 
+@lru_cache(maxsize=4096)
 def normalize_equipment_id(name: str) -> str:
     """Normalize an equipment name to a canonical ID format."""
     id_str = name.lower()
@@ -7,6 +7,10 @@ with the ISerializedUnit TypeScript interface.
 This is the new converter that outputs data-driven JSON for the megamek-web
 application. It replaces the legacy data_converter.py for BattleMech files.
 
+JSON is written with orjson when it is installed (pip install orjson),
+otherwise (or for values orjson cannot encode, such as ints beyond 64
+bits) with the stdlib json module. Output is identical either way.
+
 Usage:
     python mtf_converter.py --source /path/to/mekfiles/meks --output /path/to/output
 """
@@ -15,9 +19,15 @@ import os
 import json
 import re
 import argparse
+import tempfile
+import uuid
+from contextlib import suppress
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Any, Set, Tuple, Union
 from dataclasses import dataclass, asdict
+from functools import lru_cache
 from enum_mappings import (
     map_tech_base,
     map_rules_level,
@@ -37,41 +47,117 @@ from enum_mappings import (
     get_rules_level_folder_name,
 )
 
+try:
+    import orjson
+except ImportError:  # Optional: fall back to the stdlib encoder
+    orjson = None
+
+
+# Fluff headers open a free-text block that runs until the next empty line
+FLUFF_HEADER_RE = re.compile(
+    r'^(overview|capabilities|deployment|history|variants|notable_pilots|notes):(.*)$',
+    re.IGNORECASE
+)
+
+# First letters of the fluff headers above, used to skip the regex on most lines
+FLUFF_FIRST_CHARS = frozenset('ocdhvnOCDHVN')
+
+# Classifies non-fluff lines in one match; dispatch on lastgroup. Order
+# matters: a bare "Weapons:" is a section header, not the weapons list.
+LINE_KIND_RE = re.compile(
+    r'(?P<section>[^:]*:$)'
+    r'|(?P<weapons>(?i:weapons):)'
+    r'|(?P<pair>(?P<key>[^:]*):(?P<value>.*))'
+)
+
+# Engine values look like '300 Fusion Engine(IS)'
+ENGINE_RE = re.compile(r'(\d+)\s*(.*?)(?:\(([^)]+)\))?$')
+
+# Heat sink values look like '20 Single' or '10 Double'
+HEAT_SINKS_RE = re.compile(r'(\d+)\s*(.*)')
 
-@dataclass
+# Mech locations that open a critical slot section (e.g. "Left Arm:")
+MECH_LOCATIONS = frozenset((
+    "Head", "Center Torso", "Left Torso", "Right Torso",
+    "Left Arm", "Right Arm", "Left Leg", "Right Leg"
+))
+
+# MTF armor allocation keys -> location names
+ARMOR_LOC_MAP: Dict[str, str] = {
+    'LA': 'LEFT_ARM',
+    'RA': 'RIGHT_ARM',
+    'LT': 'LEFT_TORSO',
+    'RT': 'RIGHT_TORSO',
+    'CT': 'CENTER_TORSO',
+    'HD': 'HEAD',
+    'LL': 'LEFT_LEG',
+    'RL': 'RIGHT_LEG',
+    'RTL': 'LEFT_TORSO_REAR',
+    'RTR': 'RIGHT_TORSO_REAR',
+    'RTC': 'CENTER_TORSO_REAR',
+}
+
+# Values used when an MTF file omits a key. Shared across units, so the
+# nested dicts here must never be mutated.
+MTF_DEFAULTS: Dict[str, Any] = {
+    'chassis': 'Unknown',
+    'model': 'Unknown',
+    'mul_id': None,
+    'config': 'Biped',
+    'techbase': 'Inner Sphere',
+    'era': 3025,
+    'source': None,
+    'rules_level': '1',
+    'role': None,
+    'mass': 0,
+    'engine': {'rating': 0, 'type': 'Fusion'},
+    'structure': 'Standard',
+    'heat_sinks': {'count': 10, 'type': 'Single'},
+    'walk_mp': 0,
+    'jump_mp': 0,
+    'armor_type': 'Standard',
+    'manufacturer': None,
+    'primary_factory': None,
+}
+
+# Characters that are invalid in filenames are replaced with '-'
+SAFE_FILENAME_TABLE = str.maketrans({char: '-' for char in '/\\:*?"<>|'})
+
+
+@dataclass(slots=True)
 class SerializedEngine:
     """Engine configuration."""
     type: str
     rating: int
 
 
-@dataclass
+@dataclass(slots=True)
 class SerializedGyro:
     """Gyro configuration."""
     type: str
 
 
-@dataclass
+@dataclass(slots=True)
 class SerializedStructure:
     """Internal structure configuration."""
     type: str
 
 
-@dataclass
+@dataclass(slots=True)
 class SerializedArmor:
     """Armor configuration."""
     type: str
     allocation: Dict[str, Any]  # Can be int or {front: int, rear: int}
 
 
-@dataclass
+@dataclass(slots=True)
 class SerializedHeatSinks:
     """Heat sink configuration."""
     type: str
     count: int
 
 
-@dataclass
+@dataclass(slots=True)
 class SerializedMovement:
     """Movement configuration."""
     walk: int
@@ -80,7 +166,7 @@ class SerializedMovement:
     enhancements: Optional[List[str]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SerializedEquipment:
     """Mounted equipment item."""
     id: str
@@ -90,7 +176,7 @@ class SerializedEquipment:
     linkedAmmo: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SerializedFluff:
     """Fluff/flavor text."""
     overview: Optional[str] = None
@@ -104,7 +190,7 @@ class SerializedFluff:
     systemManufacturer: Optional[Dict[str, str]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SerializedUnit:
     """Complete serialized unit matching ISerializedUnit interface."""
     id: str
@@ -134,32 +220,136 @@ class SerializedUnit:
     source: Optional[str] = None
 
 
+# =============================================================================
+# KEY:VALUE HANDLERS
+# =============================================================================
+
+@lru_cache(maxsize=512)
+def normalize_key(raw_key: str) -> str:
+    """Normalize an MTF key, e.g. 'Walk MP' -> 'walk_mp'."""
+    return raw_key.strip().lower().replace(' ', '_')
+
+
+def _store_value(field: str) -> Callable[[str, Dict[str, Any]], None]:
+    """Build a handler that stores the raw value under the given field."""
+    def handler(value: str, data: Dict[str, Any]) -> None:
+        data[field] = value
+    return handler
+
+
+def _store_int(field: str, default: Optional[int]) -> Callable[[str, Dict[str, Any]], None]:
+    """Build a handler that stores an int, falling back to default (None skips)."""
+    def handler(value: str, data: Dict[str, Any]) -> None:
+        try:
+            data[field] = int(value)
+        except ValueError:
+            if default is not None:
+                data[field] = default
+    return handler
+
+
+def _handle_era(value: str, data: Dict[str, Any]) -> None:
+    try:
+        data['era'] = int(value)
+    except ValueError:
+        data['era'] = value
+
+
+def _handle_mass(value: str, data: Dict[str, Any]) -> None:
+    try:
+        data['mass'] = int(float(value))
+    except ValueError:
+        data['mass'] = 0
+
+
+def _handle_engine(value: str, data: Dict[str, Any]) -> None:
+    data['engine'] = MTFParser._parse_engine(value)
+
+
+def _handle_heat_sinks(value: str, data: Dict[str, Any]) -> None:
+    data['heat_sinks'] = MTFParser._parse_heat_sinks(value)
+
+
+def _handle_quirk(value: str, data: Dict[str, Any]) -> None:
+    data['quirks'].append(value)
+
+
+def _handle_system_manufacturer(value: str, data: Dict[str, Any]) -> None:
+    # Format: "CHASSIS:Foundation Type 10X"
+    if ':' in value:
+        sys_type, sys_name = value.split(':', 1)
+        data['system_manufacturers'][sys_type.strip()] = sys_name.strip()
+
+
+# Normalized MTF key -> handler(value, data). Armor allocation keys
+# ("la_armor", "rtc_armor", ...) are matched by suffix in _parse_key_value.
+KEY_HANDLERS: Dict[str, Callable[[str, Dict[str, Any]], None]] = {
+    'chassis': _store_value('chassis'),
+    'model': _store_value('model'),
+    'mul_id': _store_int('mul_id', None),
+    'config': _store_value('config'),
+    'techbase': _store_value('techbase'),
+    'era': _handle_era,
+    'source': _store_value('source'),
+    'rules_level': _store_value('rules_level'),
+    'role': _store_value('role'),
+    'mass': _handle_mass,
+    'engine': _handle_engine,
+    'structure': _store_value('structure'),
+    'myomer': _store_value('myomer'),
+    'heat_sinks': _handle_heat_sinks,
+    'walk_mp': _store_int('walk_mp', 0),
+    'jump_mp': _store_int('jump_mp', 0),
+    'armor': _store_value('armor_type'),
+    'quirk': _handle_quirk,
+    'manufacturer': _store_value('manufacturer'),
+    'primaryfactory': _store_value('primary_factory'),
+    'systemmanufacturer': _handle_system_manufacturer,
+}
+
+
 class MTFParser:
-    """Parser for MegaMek MTF files."""
-    
-    # Mech locations in order
-    MECH_LOCATIONS = [
-        "Head", "Center Torso", "Left Torso", "Right Torso",
-        "Left Arm", "Right Arm", "Left Leg", "Right Leg"
-    ]
+    """
+    Parser for MegaMek MTF files.
     
-    def __init__(self):
-        self.unknown_equipment: set = set()
+    The parser is stateless; all methods are static and may be called on
+    the class directly, e.g. MTFParser.parse_file(path).
+    """
     
-    def parse_file(self, filepath: str) -> Optional[SerializedUnit]:
-        """Parse an MTF file and return a SerializedUnit."""
+    @staticmethod
+    def parse_file(filepath: str) -> Optional[SerializedUnit]:
+        """
+        Parse an MTF file and return a SerializedUnit.
+        
+        A file that cannot be opened is reported and returns None; errors
+        while scanning or building the unit propagate to the caller.
+        """
         try:
-            with open(filepath, 'r', encoding='latin-1', errors='ignore') as f:
-                lines = f.readlines()
-            
-            return self._parse_lines(lines, filepath)
-        except Exception as e:
+            f = open(filepath, 'r', encoding='latin-1', errors='ignore')
+        except OSError as e:
             print(f"Error parsing {filepath}: {e}")
             return None
+        
+        with f:
+            # Stream lines straight from the file; MTF is parsed forward-only
+            return MTFParser._parse_lines(f, filepath)
     
-    def _parse_lines(self, lines: List[str], filepath: str) -> Optional[SerializedUnit]:
+    @staticmethod
+    def _parse_lines(lines: Iterable[str], filepath: str) -> Optional[SerializedUnit]:
         """Parse MTF content lines."""
+        return MTFParser._build_unit(MTFParser._scan_lines(lines), filepath)
+    
+    @staticmethod
+    def _scan_lines(lines: Iterable[str]) -> Dict[str, Any]:
+        """
+        Scan MTF content lines into a raw data dict.
+        
+        This is the per-line hot loop. It only builds plain dicts, lists and
+        strings, so it can be swapped for a compiled scanner without
+        touching _build_unit.
+        """
         data: Dict[str, Any] = {
+            **MTF_DEFAULTS,
             'quirks': [],
             'weapons': [],
             'criticals': {},
@@ -175,9 +365,6 @@ class MTFParser:
         current_fluff_field = None
         fluff_buffer: List[str] = []
         
-        fluff_fields = ['overview', 'capabilities', 'deployment', 'history', 
-                        'variants', 'notable_pilots', 'notes']
-        
         for line in lines:
             line_content = line.strip()
             
@@ -192,39 +379,39 @@ class MTFParser:
                 continue
             
             # Check for fluff headers
-            fluff_match = False
-            for field in fluff_fields:
-                if line_content.lower().startswith(field + ':'):
-                    if in_fluff and fluff_buffer:
-                        data['fluff'][current_fluff_field] = '\n'.join(fluff_buffer).strip()
-                    current_fluff_field = field
-                    fluff_buffer = [line_content[len(field)+1:].strip()]
-                    in_fluff = True
-                    fluff_match = True
-                    break
-            
-            if fluff_match:
+            fluff_header = None
+            if line_content[0] in FLUFF_FIRST_CHARS:
+                fluff_header = FLUFF_HEADER_RE.match(line_content)
+            if fluff_header:
+                if in_fluff and fluff_buffer:
+                    data['fluff'][current_fluff_field] = '\n'.join(fluff_buffer).strip()
+                current_fluff_field = fluff_header.group(1).lower()
+                fluff_buffer = [fluff_header.group(2).strip()]
+                in_fluff = True
                 continue
             
             if in_fluff:
                 fluff_buffer.append(line_content)
                 continue
             
+            line_kind = LINE_KIND_RE.match(line_content)
+            kind = line_kind.lastgroup if line_kind else None
+            
             # Check for section headers (e.g., "Left Arm:")
-            if line_content.endswith(':') and not ':' in line_content[:-1]:
+            if kind == 'section':
                 # Save previous section
                 if current_section and current_section_items:
                     data['criticals'][current_section] = current_section_items
                 
                 section_name = line_content[:-1]
-                if section_name in self.MECH_LOCATIONS or section_name in ['Head', 'Center Torso']:
+                if section_name in MECH_LOCATIONS:
                     current_section = section_name
                     current_section_items = []
                     in_weapons_section = False
                 continue
             
             # Check for weapons section
-            if line_content.lower().startswith('weapons:'):
+            if kind == 'weapons':
                 in_weapons_section = True
                 if current_section and current_section_items:
                     data['criticals'][current_section] = current_section_items
@@ -245,12 +432,11 @@ class MTFParser:
                 continue
             
             # Parse key:value lines
-            if ':' in line_content:
-                key, value = line_content.split(':', 1)
-                key = key.strip().lower().replace(' ', '_')
-                value = value.strip()
+            if kind == 'pair':
+                key = normalize_key(line_kind.group('key'))
+                value = line_kind.group('value').strip()
                 
-                self._parse_key_value(key, value, data)
+                MTFParser._parse_key_value(key, value, data)
                 continue
             
             # Parse critical slot items
@@ -265,60 +451,14 @@ class MTFParser:
         if in_fluff and fluff_buffer:
             data['fluff'][current_fluff_field] = '\n'.join(fluff_buffer).strip()
         
-        # Build the serialized unit
-        return self._build_unit(data, filepath)
+        return data
     
-    def _parse_key_value(self, key: str, value: str, data: Dict[str, Any]) -> None:
+    @staticmethod
+    def _parse_key_value(key: str, value: str, data: Dict[str, Any]) -> None:
         """Parse a key:value line."""
-        if key == 'chassis':
-            data['chassis'] = value
-        elif key == 'model':
-            data['model'] = value
-        elif key == 'mul_id':
-            try:
-                data['mul_id'] = int(value)
-            except ValueError:
-                pass
-        elif key == 'config':
-            data['config'] = value
-        elif key == 'techbase':
-            data['techbase'] = value
-        elif key == 'era':
-            try:
-                data['era'] = int(value)
-            except ValueError:
-                data['era'] = value
-        elif key == 'source':
-            data['source'] = value
-        elif key == 'rules_level':
-            data['rules_level'] = value
-        elif key == 'role':
-            data['role'] = value
-        elif key == 'mass':
-            try:
-                data['mass'] = int(float(value))
-            except ValueError:
-                data['mass'] = 0
-        elif key == 'engine':
-            data['engine'] = self._parse_engine(value)
-        elif key == 'structure':
-            data['structure'] = value
-        elif key == 'myomer':
-            data['myomer'] = value
-        elif key == 'heat_sinks':
-            data['heat_sinks'] = self._parse_heat_sinks(value)
-        elif key == 'walk_mp':
-            try:
-                data['walk_mp'] = int(value)
-            except ValueError:
-                data['walk_mp'] = 0
-        elif key == 'jump_mp':
-            try:
-                data['jump_mp'] = int(value)
-            except ValueError:
-                data['jump_mp'] = 0
-        elif key == 'armor':
-            data['armor_type'] = value
+        handler = KEY_HANDLERS.get(key)
+        if handler:
+            handler(value, data)
         elif key.endswith('_armor') or key.endswith('armor'):
             # Armor allocation
             loc_key = key.replace('_armor', '').replace('armor', '').strip().upper()
@@ -326,21 +466,11 @@ class MTFParser:
                 data['armor_allocation'][loc_key] = int(value)
             except ValueError:
                 pass
-        elif key == 'quirk':
-            data['quirks'].append(value)
-        elif key == 'manufacturer':
-            data['manufacturer'] = value
-        elif key == 'primaryfactory':
-            data['primary_factory'] = value
-        elif key == 'systemmanufacturer':
-            # Format: "CHASSIS:Foundation Type 10X"
-            if ':' in value:
-                sys_type, sys_name = value.split(':', 1)
-                data['system_manufacturers'][sys_type.strip()] = sys_name.strip()
-    
-    def _parse_engine(self, value: str) -> Dict[str, Any]:
+    
+    @staticmethod
+    def _parse_engine(value: str) -> Dict[str, Any]:
         """Parse engine string like '300 Fusion Engine(IS)'."""
-        match = re.match(r'(\d+)\s*(.*?)(?:\(([^)]+)\))?$', value)
+        match = ENGINE_RE.match(value)
         if match:
             rating = int(match.group(1))
             type_name = match.group(2).strip()
@@ -349,19 +479,21 @@ class MTFParser:
             return {'rating': rating, 'type': full_type}
         return {'rating': 0, 'type': value}
     
-    def _parse_heat_sinks(self, value: str) -> Dict[str, Any]:
+    @staticmethod
+    def _parse_heat_sinks(value: str) -> Dict[str, Any]:
         """Parse heat sink string like '20 Single' or '10 Double'."""
-        match = re.match(r'(\d+)\s*(.*)', value)
+        match = HEAT_SINKS_RE.match(value)
         if match:
             count = int(match.group(1))
             hs_type = match.group(2).strip() if match.group(2) else 'Single'
             return {'count': count, 'type': hs_type}
         return {'count': 10, 'type': 'Single'}
     
-    def _build_unit(self, data: Dict[str, Any], filepath: str) -> Optional[SerializedUnit]:
+    @staticmethod
+    def _build_unit(data: Dict[str, Any], filepath: str) -> Optional[SerializedUnit]:
         """Build a SerializedUnit from parsed data."""
-        chassis = data.get('chassis', 'Unknown')
-        model = data.get('model', 'Unknown')
+        chassis = data['chassis']
+        model = data['model']
         
         if chassis == 'Unknown':
             return None
@@ -370,7 +502,7 @@ class MTFParser:
         unit_id = generate_id_from_name(chassis, model)
         
         # Get year and era
-        year = data.get('era', 3025)
+        year = data['era']
         if isinstance(year, str):
             try:
                 year = int(year)
@@ -380,10 +512,10 @@ class MTFParser:
         era = map_year_to_era(year)
         
         # Parse engine
-        engine_data = data.get('engine', {'rating': 0, 'type': 'Fusion'})
+        engine_data = data['engine']
         engine = SerializedEngine(
-            type=map_engine_type(engine_data.get('type', 'Fusion')),
-            rating=engine_data.get('rating', 0)
+            type=map_engine_type(engine_data['type']),
+            rating=engine_data['rating']
         )
         
         # Parse gyro (inferred from engine type or default)
@@ -393,35 +525,35 @@ class MTFParser:
         cockpit = 'STANDARD'
         
         # Parse structure
-        structure_str = data.get('structure', 'Standard')
+        structure_str = data['structure']
         structure = SerializedStructure(type=map_structure_type(structure_str))
         
         # Parse heat sinks
-        hs_data = data.get('heat_sinks', {'count': 10, 'type': 'Single'})
+        hs_data = data['heat_sinks']
         heat_sinks = SerializedHeatSinks(
-            type=map_heat_sink_type(hs_data.get('type', 'Single')),
-            count=hs_data.get('count', 10)
+            type=map_heat_sink_type(hs_data['type']),
+            count=hs_data['count']
         )
         
         # Parse armor
-        armor_type = map_armor_type(data.get('armor_type', 'Standard'))
-        armor_allocation = self._build_armor_allocation(data.get('armor_allocation', {}))
+        armor_type = map_armor_type(data['armor_type'])
+        armor_allocation = MTFParser._build_armor_allocation(data['armor_allocation'])
         armor = SerializedArmor(type=armor_type, allocation=armor_allocation)
         
         # Parse movement
         movement = SerializedMovement(
-            walk=data.get('walk_mp', 0),
-            jump=data.get('jump_mp', 0)
+            walk=data['walk_mp'],
+            jump=data['jump_mp']
         )
         
         # Build equipment list from weapons
-        equipment = self._build_equipment_list(data.get('weapons', []))
+        equipment = MTFParser._build_equipment_list(data['weapons'])
         
         # Build critical slots
-        critical_slots = self._build_critical_slots(data.get('criticals', {}))
+        critical_slots = MTFParser._build_critical_slots(data['criticals'])
         
         # Build fluff
-        fluff_data = data.get('fluff', {})
+        fluff_data = data['fluff']
         fluff = None
         if fluff_data:
             fluff = SerializedFluff(
@@ -429,22 +561,22 @@ class MTFParser:
                 capabilities=fluff_data.get('capabilities'),
                 history=fluff_data.get('history'),
                 deployment=fluff_data.get('deployment'),
-                manufacturer=data.get('manufacturer'),
-                primaryFactory=data.get('primary_factory'),
-                systemManufacturer=data.get('system_manufacturers') if data.get('system_manufacturers') else None
+                manufacturer=data['manufacturer'],
+                primaryFactory=data['primary_factory'],
+                systemManufacturer=data['system_manufacturers'] or None
             )
         
         return SerializedUnit(
             id=unit_id,
             chassis=chassis,
             model=model,
-            unitType=map_unit_type(data.get('config', 'Biped')),
-            configuration=map_mech_config(data.get('config', 'Biped')),
-            techBase=map_tech_base(data.get('techbase', 'Inner Sphere')),
-            rulesLevel=map_rules_level(data.get('rules_level', '1')),
+            unitType=map_unit_type(data['config']),
+            configuration=map_mech_config(data['config']),
+            techBase=map_tech_base(data['techbase']),
+            rulesLevel=map_rules_level(data['rules_level']),
             era=era,
             year=year,
-            tonnage=data.get('mass', 0),
+            tonnage=data['mass'],
             engine=engine,
             gyro=gyro,
             cockpit=cockpit,
@@ -454,56 +586,41 @@ class MTFParser:
             movement=movement,
             equipment=equipment,
             criticalSlots=critical_slots,
-            quirks=data.get('quirks') if data.get('quirks') else None,
+            quirks=data['quirks'] or None,
             fluff=fluff,
-            mulId=data.get('mul_id'),
-            role=data.get('role'),
-            source=data.get('source')
+            mulId=data['mul_id'],
+            role=data['role'],
+            source=data['source']
         )
     
-    def _build_armor_allocation(self, raw_allocation: Dict[str, int]) -> Dict[str, Any]:
+    @staticmethod
+    def _build_armor_allocation(raw_allocation: Dict[str, int]) -> Dict[str, Any]:
         """Build armor allocation with proper location names and front/rear handling."""
         allocation: Dict[str, Any] = {}
+        rear_armor: List[Tuple[str, int]] = []
         
-        # Location mapping
-        loc_map = {
-            'LA': 'LEFT_ARM',
-            'RA': 'RIGHT_ARM',
-            'LT': 'LEFT_TORSO',
-            'RT': 'RIGHT_TORSO',
-            'CT': 'CENTER_TORSO',
-            'HD': 'HEAD',
-            'LL': 'LEFT_LEG',
-            'RL': 'RIGHT_LEG',
-            'RTL': 'LEFT_TORSO_REAR',
-            'RTR': 'RIGHT_TORSO_REAR',
-            'RTC': 'CENTER_TORSO_REAR',
-        }
-        
-        # First pass: collect front armor
+        # Collect front armor, setting rear armor aside until all fronts are known
         for key, value in raw_allocation.items():
-            mapped_loc = loc_map.get(key, key)
-            if 'REAR' not in mapped_loc:
+            mapped_loc = ARMOR_LOC_MAP.get(key, key)
+            if 'REAR' in mapped_loc:
+                rear_armor.append((mapped_loc.replace('_REAR', ''), value))
+            else:
                 allocation[mapped_loc] = value
         
-        # Second pass: merge rear armor into torso locations
-        for key, value in raw_allocation.items():
-            mapped_loc = loc_map.get(key, key)
-            if 'REAR' in mapped_loc:
-                # Get the front location name
-                front_loc = mapped_loc.replace('_REAR', '')
-                if front_loc in allocation:
-                    # Convert to front/rear object
-                    front_value = allocation[front_loc]
-                    if isinstance(front_value, int):
-                        allocation[front_loc] = {
-                            'front': front_value,
-                            'rear': value
-                        }
+        # Merge rear armor into torso locations
+        for front_loc, value in rear_armor:
+            front_value = allocation.get(front_loc)
+            if isinstance(front_value, int):
+                # Convert to front/rear object
+                allocation[front_loc] = {
+                    'front': front_value,
+                    'rear': value
+                }
         
         return allocation
     
-    def _build_equipment_list(self, weapons: List[Dict[str, str]]) -> List[SerializedEquipment]:
+    @staticmethod
+    def _build_equipment_list(weapons: List[Dict[str, str]]) -> List[SerializedEquipment]:
         """Build equipment list from weapons data."""
         equipment: List[SerializedEquipment] = []
         
@@ -529,7 +646,8 @@ class MTFParser:
         
         return equipment
     
-    def _build_critical_slots(self, criticals: Dict[str, List[str]]) -> Dict[str, List[Optional[str]]]:
+    @staticmethod
+    def _build_critical_slots(criticals: Dict[str, List[str]]) -> Dict[str, List[Optional[str]]]:
         """Build critical slots dictionary with proper slot counts per location."""
         slots: Dict[str, List[Optional[str]]] = {}
         
@@ -576,10 +694,66 @@ class MTFParser:
         return slots
 
 
+# Permissions for worker temp files. mkstemp creates files as 0600, so they
+# are widened to what a plain open() would give before being moved into place.
+_umask = os.umask(0)
+os.umask(_umask)
+OUTPUT_FILE_MODE = 0o666 & ~_umask
+
+# Output directories already created by this conversion worker. Reset by
+# _init_worker at the start of each convert_directory pool, so at most one
+# makedirs call per directory per worker per run.
+_made_dirs: Set[str] = set()
+
+
+def _init_worker() -> None:
+    """Pool initializer: drop any directory cache inherited from the parent."""
+    _made_dirs.clear()
+
+
+def _ensure_dir(path: Union[str, Path]) -> None:
+    """Create a directory (and parents) unless this worker already did."""
+    key = str(path)
+    if key not in _made_dirs:
+        os.makedirs(key, exist_ok=True)
+        _made_dirs.add(key)
+
+
+def encode_json(data: Any) -> bytes:
+    """Encode data as indented UTF-8 JSON, using orjson when available."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        except orjson.JSONEncodeError:
+            # e.g. ints beyond 64 bits, which the stdlib encoder handles
+            pass
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def write_json(path: Union[str, Path], data: Any) -> None:
+    """Write data as indented UTF-8 JSON, encoding before the file is opened."""
+    # Encode first so an encode error never truncates an existing file
+    content = encode_json(data)
+    with open(path, 'wb') as f:
+        f.write(content)
+
+
+def read_json(path: Path) -> Any:
+    """Read a JSON file, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
 def convert_mtf_file(input_path: str, output_path: str) -> bool:
-    """Convert a single MTF file to JSON."""
-    parser = MTFParser()
-    unit = parser.parse_file(input_path)
+    """Convert a single MTF file to JSON. Returns False if it cannot be parsed."""
+    try:
+        unit = MTFParser.parse_file(input_path)
+    except Exception as e:
+        # parse_file only handles read errors; report unit-building errors here
+        print(f"Error parsing {input_path}: {e}")
+        return False
     
     if unit is None:
         return False
@@ -589,8 +763,7 @@ def convert_mtf_file(input_path: str, output_path: str) -> bool:
     
     # Write JSON
     os.makedirs(os.path.dirname(output_path), exist_ok=True)
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(unit_dict, f, indent=2, ensure_ascii=False)
+    write_json(output_path, unit_dict)
     
     return True
 
@@ -614,7 +787,114 @@ def dataclass_to_dict(obj: Any) -> Any:
         return obj
 
 
-def convert_directory(source_dir: str, output_dir: str, era_filter: Optional[str] = None) -> Tuple[int, int]:
+def _walk_mtf(root: str) -> Iterator[str]:
+    """Yield paths of all .mtf files under root, without following symlinked dirs."""
+    try:
+        entries = list(os.scandir(root))
+    except OSError:
+        return
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            yield from _walk_mtf(entry.path)
+        elif os.path.normcase(entry.name).endswith('.mtf'):
+            # normcase matches rglob: case-insensitive on Windows only
+            yield entry.path
+
+
+def _index_entry(unit_data: Dict[str, Any], relative_path: str) -> Dict[str, Any]:
+    """Build an index.json entry from a serialized unit dict."""
+    return {
+        'id': unit_data.get('id', ''),
+        'chassis': unit_data.get('chassis', ''),
+        'model': unit_data.get('model', ''),
+        'tonnage': unit_data.get('tonnage', 0),
+        'techBase': unit_data.get('techBase', ''),
+        'year': unit_data.get('year', 0),
+        'role': unit_data.get('role', ''),
+        'rulesLevel': unit_data.get('rulesLevel', ''),
+        'path': relative_path.replace('\\', '/')
+    }
+
+
+def _remove_temp_files(output_dir: str, temp_prefix: str) -> None:
+    """Delete worker temp files left under output_dir by an unfinished run."""
+    for dirpath, _, filenames in os.walk(output_dir):
+        for filename in filenames:
+            if filename.startswith(temp_prefix) and filename.endswith('.tmp'):
+                with suppress(FileNotFoundError):
+                    os.remove(os.path.join(dirpath, filename))
+
+
+def _convert_one(
+    mtf_path: str,
+    output_dir: str,
+    era_filter: Optional[str] = None,
+    temp_prefix: str = '.',
+) -> Tuple[Optional[bool], str, Optional[Dict[str, Any]]]:
+    """
+    Convert a single MTF file into the era/rules-level output tree.
+
+    Runs inside a worker process, so it must stay module-level to pickle.
+    The unit is written to a temp file (named with temp_prefix) next to its
+    final path; the parent moves it into place so duplicate output paths
+    resolve in input order.
+
+    Returns tuple of (success, temp_path_or_error, index_entry). success is
+    None when the unit was skipped by the era filter; index_entry is only
+    set on success.
+    """
+    try:
+        # Parse the file to get era and rules level
+        unit = MTFParser.parse_file(mtf_path)
+        
+        if unit is None:
+            return False, f"Failed to parse: {mtf_path}", None
+        
+        # Get era folder from unit's year
+        era_folder = get_era_folder_name(unit.era)
+        
+        # Get rules level folder
+        rules_folder = get_rules_level_folder_name(unit.rulesLevel)
+        
+        # Apply era filter if specified
+        if era_filter and era_filter.lower() not in era_folder.lower():
+            return None, mtf_path, None
+        
+        # Build output path: era/rules_level/filename.json
+        # Sanitize filename to replace invalid characters
+        safe_name = f"{unit.chassis} {unit.model}".translate(SAFE_FILENAME_TABLE)
+        json_filename = f"{safe_name}.json"
+        json_file = Path(output_dir) / era_folder / rules_folder / json_filename
+        
+        # Convert dataclasses to dicts
+        unit_dict = dataclass_to_dict(unit)
+        
+        # Write JSON to a temp file; the parent renames it to json_file.
+        # The name is short and fixed-length so it fits wherever json_file does.
+        _ensure_dir(json_file.parent)
+        fd, temp_path = tempfile.mkstemp(dir=json_file.parent, prefix=temp_prefix, suffix='.tmp')
+        os.close(fd)
+        try:
+            write_json(temp_path, unit_dict)
+            os.chmod(temp_path, OUTPUT_FILE_MODE)
+        except BaseException:
+            with suppress(FileNotFoundError):
+                os.remove(temp_path)
+            raise
+        
+        relative_path = f"{era_folder}/{rules_folder}/{json_filename}"
+        return True, temp_path, _index_entry(unit_dict, relative_path)
+        
+    except Exception as e:
+        return False, f"Failed: {mtf_path} - {e}", None
+
+
+def convert_directory(
+    source_dir: str,
+    output_dir: str,
+    era_filter: Optional[str] = None,
+    max_workers: Optional[int] = None,
+) -> Tuple[int, int, List[Dict[str, Any]]]:
     """
     Convert all MTF files in a directory.
     
@@ -622,63 +902,69 @@ def convert_directory(source_dir: str, output_dir: str, era_filter: Optional[str
     - succession-wars/standard/Atlas AS7-D.json
     - clan-invasion/advanced/Mad Cat Prime.json
     
-    Returns tuple of (successful, failed) counts.
+    Each file is independent, so conversion is spread across a process pool.
+    Workers write their own output, so one worker's write overlaps with the
+    others' parsing. max_workers=None uses the executor default (the CPU
+    count, capped on Windows); raise it on slow or networked storage to keep
+    cores busy while writes are blocked.
+    
+    Results are moved into place in input order, so when several files map
+    to the same output path the last one wins and matches its index entry.
+    
+    Returns tuple of (successful, failed, index_entries). The index entries
+    cover the units written by this run and can be passed to generate_index
+    to avoid re-reading the output tree.
     """
     success_count = 0
     fail_count = 0
+    # Keyed by output path so a unit written twice is only indexed once
+    index_entries: Dict[str, Dict[str, Any]] = {}
     
-    source_path = Path(source_dir)
-    output_path = Path(output_dir)
-    parser = MTFParser()
+    # Group files by directory so each chunk reads from as few directories
+    # as possible while their metadata is still in the page cache
+    paths = sorted(_walk_mtf(source_dir), key=os.path.dirname)
     
-    for mtf_file in source_path.rglob('*.mtf'):
-        try:
-            # Parse the file to get era and rules level
-            unit = parser.parse_file(str(mtf_file))
-            
-            if unit is None:
-                fail_count += 1
-                print(f"Failed to parse: {mtf_file}")
-                continue
-            
-            # Get era folder from unit's year
-            era_folder = get_era_folder_name(unit.era)
-            
-            # Get rules level folder
-            rules_folder = get_rules_level_folder_name(unit.rulesLevel)
-            
-            # Apply era filter if specified
-            if era_filter and era_filter.lower() not in era_folder.lower():
-                continue
-            
-            # Build output path: era/rules_level/filename.json
-            # Sanitize filename to replace invalid characters
-            safe_name = f"{unit.chassis} {unit.model}"
-            # Replace characters that are invalid in filenames
-            for char in ['/', '\\', ':', '*', '?', '"', '<', '>', '|']:
-                safe_name = safe_name.replace(char, '-')
-            json_filename = f"{safe_name}.json"
-            json_file = output_path / era_folder / rules_folder / json_filename
-            
-            # Convert dataclasses to dicts
-            unit_dict = dataclass_to_dict(unit)
-            
-            # Write JSON
-            os.makedirs(json_file.parent, exist_ok=True)
-            with open(json_file, 'w', encoding='utf-8') as f:
-                json.dump(unit_dict, f, indent=2, ensure_ascii=False)
-            
-            success_count += 1
-            
-        except Exception as e:
-            fail_count += 1
-            print(f"Failed: {mtf_file} - {e}")
+    # Unique per run, so leftovers from an interrupted run can be found
+    temp_prefix = f".mtf-{uuid.uuid4().hex[:8]}-"
+    finished = False
     
-    return success_count, fail_count
+    try:
+        # Tasks are short, so use a large chunksize to amortize IPC overhead
+        with ProcessPoolExecutor(
+            max_workers=max_workers, initializer=_init_worker
+        ) as executor:
+            results = executor.map(
+                _convert_one, paths, repeat(output_dir), repeat(era_filter),
+                repeat(temp_prefix), chunksize=32
+            )
+            for ok, message, entry in results:
+                if ok is None:
+                    continue
+                if ok:
+                    try:
+                        os.replace(message, os.path.join(output_dir, entry['path']))
+                    except OSError as e:
+                        fail_count += 1
+                        print(f"Failed: {message} - {e}")
+                        with suppress(FileNotFoundError):
+                            os.remove(message)
+                        continue
+                    success_count += 1
+                    index_entries[entry['path']] = entry
+                else:
+                    fail_count += 1
+                    print(message)
+        finished = True
+    finally:
+        # Every result was moved or removed above unless the run was cut short
+        if not finished:
+            _remove_temp_files(output_dir, temp_prefix)
+    
+    return success_count, fail_count, list(index_entries.values())
 
 
-def generate_index(output_dir: str) -> Dict[str, Any]:
-    """Generate an index.json for all converted units."""
+def scan_index_entries(output_dir: str) -> List[Dict[str, Any]]:
+    """Build index entries by reading every converted unit in output_dir."""
     output_path = Path(output_dir)
     units: List[Dict[str, Any]] = []
     
@@ -687,25 +973,30 @@ def generate_index(output_dir: str) -> Dict[str, Any]:
             continue
         
         try:
-            with open(json_file, 'r', encoding='utf-8') as f:
-                unit_data = json.load(f)
+            unit_data = read_json(json_file)
             
             # Create index entry
             relative_path = json_file.relative_to(output_path)
-            units.append({
-                'id': unit_data.get('id', ''),
-                'chassis': unit_data.get('chassis', ''),
-                'model': unit_data.get('model', ''),
-                'tonnage': unit_data.get('tonnage', 0),
-                'techBase': unit_data.get('techBase', ''),
-                'year': unit_data.get('year', 0),
-                'role': unit_data.get('role', ''),
-                'rulesLevel': unit_data.get('rulesLevel', ''),
-                'path': str(relative_path).replace('\\', '/')
-            })
+            units.append(_index_entry(unit_data, str(relative_path)))
         except Exception as e:
             print(f"Error indexing {json_file}: {e}")
     
+    return units
+
+
+def generate_index(output_dir: str, units: Optional[List[Dict[str, Any]]] = None) -> Dict[str, Any]:
+    """
+    Generate an index.json for all converted units.
+    
+    If units is given (as returned by convert_directory) it is used as-is;
+    otherwise output_dir is rescanned for converted unit files.
+    """
+    output_path = Path(output_dir)
+    if units is None:
+        units = scan_index_entries(output_dir)
+    else:
+        units = list(units)
+    
     # Sort by chassis then model
     units.sort(key=lambda x: (x['chassis'], x['model']))
     
@@ -718,25 +1009,47 @@ def generate_index(output_dir: str) -> Dict[str, Any]:
     
     # Write index
     index_path = output_path / 'index.json'
-    with open(index_path, 'w', encoding='utf-8') as f:
-        json.dump(index, f, indent=2, ensure_ascii=False)
+    write_json(index_path, index)
     
     return index
 
 
+def _positive_int(value: str) -> int:
+    """argparse type for counts that must be at least 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: '{value}'")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
+def _is_empty_dir(path: str) -> bool:
+    """True if path is missing or an empty directory."""
+    if not os.path.isdir(path):
+        return not os.path.exists(path)
+    with os.scandir(path) as entries:
+        return not any(entries)
+
+
 def main():
     parser = argparse.ArgumentParser(description='Convert MTF files to JSON')
     parser.add_argument('--source', '-s', required=True, help='Source directory containing MTF files')
     parser.add_argument('--output', '-o', required=True, help='Output directory for JSON files')
     parser.add_argument('--era', '-e', help='Filter by era folder name')
     parser.add_argument('--generate-index', '-i', action='store_true', help='Generate index.json after conversion')
+    parser.add_argument('--workers', '-w', type=_positive_int, help='Number of worker processes (default: CPU count)')
     
     args = parser.parse_args()
     
     print(f"Converting MTF files from: {args.source}")
     print(f"Output directory: {args.output}")
     
-    success, failed = convert_directory(args.source, args.output, args.era)
+    # Only an empty output directory is fully covered by this run's units
+    output_was_empty = _is_empty_dir(args.output)
+    
+    success, failed, index_entries = convert_directory(args.source, args.output, args.era, args.workers)
     
     print(f"\nConversion complete:")
     print(f"  Successful: {success}")
@@ -744,7 +1057,9 @@ def main():
     
     if args.generate_index:
         print("\nGenerating index...")
-        index = generate_index(args.output)
+        # Otherwise rescan, so units from earlier runs (other eras or source
+        # subtrees converted into the same output) stay in the index
+        index = generate_index(args.output, index_entries if output_was_empty else None)
         print(f"Index generated with {index['totalUnits']} units")
 
 